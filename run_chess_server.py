@@ -1,13 +1,12 @@
 """Entry point to run the chess server standalone."""
 
-import asyncio
 import logging
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(__file__).rsplit("src", 1)[0])
 
-from src.chess_server.server import run_server
+from src.chess_server.server import serve
 
 
 def main():
@@ -28,7 +27,7 @@ def main():
     print()
 
     try:
-        asyncio.run(run_server(host="0.0.0.0", port=8765))
+        serve(host="0.0.0.0", port=8765)
     except KeyboardInterrupt:
         print("\nServer stopped.")
 
@@ -4,6 +4,9 @@ import functools
 import logging
 from typing import Any, Callable, TypeVar
 
+import aiohttp
+from livekit.agents.utils import http_context
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -13,6 +16,11 @@ logging.basicConfig(
 T = TypeVar("T")
 
 
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the job's shared aiohttp session (closed by LiveKit on job end)."""
+    return http_context.http_session()
+
+
 def handle_tool_error(tool_name: str) -> Callable:
     """Decorator for consistent error handling in tools."""
 
@@ -8,9 +8,9 @@ import asyncio
 import logging
 import random
 
-import aiohttp
 from livekit.agents import function_tool
 
+from ..base import get_http_session
 from .adapters.remote_stockfish import RemoteStockfishAdapter
 from .engine_interface import MoveResult
 
@@ -43,6 +43,16 @@ THINKING_DELAYS = {
 }
 
 
+def _pick_thinking_time(difficulty: str) -> float:
+    """Pick a human-like thinking delay for a difficulty, in seconds."""
+    return random.uniform(*THINKING_DELAYS.get(difficulty, (5.0, 10.0)))
+
+
+async def thinking_pause(difficulty: str = "medium") -> None:
+    """Wait as long as ANA would think at this difficulty, without analyzing."""
+    await asyncio.sleep(_pick_thinking_time(difficulty))
+
+
 async def _get_move_with_delay(
     fen: str,
     difficulty: str = "medium",
@@ -59,10 +69,9 @@ async def _get_move_with_delay(
     """
     engine = _get_engine()
     depth = DIFFICULTY_DEPTHS.get(difficulty, 8)
-    delay_range = THINKING_DELAYS.get(difficulty, (5.0, 10.0))
 
     # Human-like thinking delay
-    thinking_time = random.uniform(*delay_range)
+    thinking_time = _pick_thinking_time(difficulty)
     logger.info(f"Chess: Thinking for {thinking_time:.1f}s at depth {depth}...")
 
     # Start both the delay and the analysis
@@ -104,18 +113,15 @@ async def analyze_chess_position(
 
         # Apply move to game server if game_id provided
         if game_id:
-            async with aiohttp.ClientSession() as session:
-                url = "http://localhost:8765/api/move"
-                payload = {
-                    "game_id": game_id,
-                    "move": result.move,
-                    "explanation": result.explanation or f"Playing {result.san}",
-                }
-                async with session.post(url, json=payload) as resp:
-                    if resp.status != 200:
-                        logger.error(
-                            f"Failed to apply move to server: {await resp.text()}"
-                        )
+            url = "http://localhost:8765/api/move"
+            payload = {
+                "game_id": game_id,
+                "move": result.move,
+                "explanation": result.explanation or f"Playing {result.san}",
+            }
+            async with get_http_session().post(url, json=payload) as resp:
+                if resp.status != 200:
+                    logger.error(f"Failed to apply move to server: {await resp.text()}")
 
         if result.mate_in is not None:
             if (result.mate_in > 0 and player_color == "white") or (
@@ -144,31 +150,28 @@ async def get_active_chess_games() -> str:
     Returns a current summary of active games, including their IDs, players, and positions.
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            url = "http://localhost:8765/health"
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    games = data.get("games", [])
-                    if not games:
-                        return (
-                            "There are no active chess games on the server right now."
-                        )
-
-                    results = []
-                    for g in games:
-                        white = g.get("white", {}).get("name", "Unknown")
-                        black = g.get("black", {}).get("name", "Unknown")
-                        results.append(
-                            f"Game ID: {g.get('id')}\n"
-                            f"Players: {white} (White) vs {black} (Black)\n"
-                            f"Status: {g.get('status')}\n"
-                            f"Position (FEN): {g.get('fen')}"
-                        )
-
-                    return "Active Chess Games:\n\n" + "\n---\n".join(results)
-                else:
-                    return "I couldn't reach the chess server right now."
+        url = "http://localhost:8765/health"
+        async with get_http_session().get(url) as resp:
+            if resp.status == 200:
+                data = await resp.json()
+                games = data.get("games", [])
+                if not games:
+                    return "There are no active chess games on the server right now."
+
+                results = []
+                for g in games:
+                    white = g.get("white", {}).get("name", "Unknown")
+                    black = g.get("black", {}).get("name", "Unknown")
+                    results.append(
+                        f"Game ID: {g.get('id')}\n"
+                        f"Players: {white} (White) vs {black} (Black)\n"
+                        f"Status: {g.get('status')}\n"
+                        f"Position (FEN): {g.get('fen')}"
+                    )
+
+                return "Active Chess Games:\n\n" + "\n---\n".join(results)
+            else:
+                return "I couldn't reach the chess server right now."
     except Exception as e:
         return f"Error connecting to chess server: {str(e)}"
 
@@ -1,8 +1,10 @@
 """Email-related tools."""
 
 import asyncio
+import atexit
 import logging
 import smtplib
+import threading
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from typing import Optional
@@ -12,6 +14,51 @@ from livekit.agents import RunContext, function_tool
 from ..config import config
 from .base import handle_tool_error
 
+# Logged-in SMTP connection reused across emails, guarded by _smtp_lock
+_smtp: Optional[smtplib.SMTP] = None
+_smtp_lock = threading.Lock()
+
+
+def _close_smtp() -> None:
+    """Close the cached SMTP connection, if any."""
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            _smtp.close()
+        _smtp = None
+
+
+def _get_smtp(email_config: dict) -> smtplib.SMTP:
+    """Get the logged-in SMTP connection, reconnecting if it has dropped.
+
+    Must be called with _smtp_lock held.
+    """
+    global _smtp
+    if _smtp is not None:
+        try:
+            if _smtp.noop()[0] == 250:
+                return _smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_smtp()
+
+    server = smtplib.SMTP(
+        email_config["smtp_server"], email_config["smtp_port"], timeout=10
+    )
+    try:
+        server.starttls()
+        server.login(email_config["user"], email_config["password"])
+    except Exception:
+        server.close()
+        raise
+    _smtp = server
+    return server
+
+
+atexit.register(_close_smtp)
+
 
 @function_tool()
 @handle_tool_error("send_email")
@@ -55,17 +102,21 @@ async def send_email(
     def _send_email_blocking():
         """Blocking email send operation to run in executor."""
         try:
-            # Connect to Gmail SMTP server
-            server = smtplib.SMTP(
-                email_config["smtp_server"], email_config["smtp_port"], timeout=10
-            )
-            server.starttls()
-            server.login(email_config["user"], email_config["password"])
-
-            # Send email
             text = msg.as_string()
-            server.sendmail(email_config["user"], recipients, text)
-            server.quit()
+            with _smtp_lock:
+                # Reuse the Gmail connection; only the first email logs in
+                server = _get_smtp(email_config)
+                try:
+                    server.sendmail(email_config["user"], recipients, text)
+                except smtplib.SMTPServerDisconnected:
+                    # Dropped after the NOOP check: reconnect once and retry
+                    _close_smtp()
+                    server = _get_smtp(email_config)
+                    try:
+                        server.sendmail(email_config["user"], recipients, text)
+                    except smtplib.SMTPServerDisconnected:
+                        _close_smtp()
+                        raise
 
             logging.info(f"Email sent successfully to {to_email}")
             return f"Email sent successfully to {to_email}"
@@ -77,6 +128,5 @@ async def send_email(
             logging.error(f"SMTP error occurred: {e}")
             return f"Email sending failed: SMTP error - {str(e)}"
 
-    # Run blocking SMTP operations in executor
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, _send_email_blocking)
+    # Run blocking SMTP operations in a worker thread
+    return await asyncio.to_thread(_send_email_blocking)
@@ -23,6 +23,7 @@ class ArduinoController:
         self._init_lock = (
             asyncio.Lock()
         )  # <- lock to prevent race condition during initialization
+        self._io_lock = asyncio.Lock()  # <- one command on the serial port at a time
 
     def _initialize_connection(self) -> None:
         """Attempt to establish Arduino connection once at startup."""
@@ -56,28 +57,27 @@ class ArduinoController:
             async with self._init_lock:
                 # Double-check inside the lock to prevent duplicate initializations
                 if not self._initialized:
-                    loop = asyncio.get_event_loop()
-                    await loop.run_in_executor(None, self._initialize_connection)
+                    await asyncio.to_thread(self._initialize_connection)
 
         conn = self.get_connection()
         if not conn:
             return "⚠️ Arduino not connected"
         try:
-            # Run blocking I/O in executor
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, lambda: conn.write(f"{command}\n".encode())
-            )
-            await asyncio.sleep(0.1)
-            response = await loop.run_in_executor(
-                None,
-                lambda: conn.readline().decode().strip() if conn.in_waiting else "OK",
-            )
-            return response
+            # Run the whole blocking exchange in one worker thread; the lock
+            # keeps concurrent tools from interleaving writes and replies
+            async with self._io_lock:
+                return await asyncio.to_thread(self._exchange, conn, command)
         except Exception as e:
             logging.error(f"Arduino command error: {e}")
             return f"Error: {e}"
 
+    @staticmethod
+    def _exchange(conn: serial.Serial, command: str) -> str:
+        """Write a command and read the reply (blocking, run off the event loop)."""
+        conn.write(f"{command}\n".encode())
+        time.sleep(0.1)
+        return conn.readline().decode().strip() if conn.in_waiting else "OK"
+
     def _format_response(self, response: str, success_msg: str) -> str:
         """Format Arduino response for user."""
         if "not connected" in response:
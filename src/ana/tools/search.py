@@ -1,15 +1,28 @@
 """Web search tools."""
 
+import asyncio
 import logging
 import re
 import subprocess
 import webbrowser
 from urllib.parse import quote_plus
 
-import aiohttp
 from livekit.agents import RunContext, function_tool
 
-from .base import handle_tool_error
+from .base import get_http_session, handle_tool_error
+
+# Search tool instance, created on first search (import is slow)
+_search_tool = None
+
+
+def _get_search_tool():
+    """Get or create the DuckDuckGo search tool."""
+    global _search_tool
+    if _search_tool is None:
+        from langchain_community.tools import DuckDuckGoSearchRun
+
+        _search_tool = DuckDuckGoSearchRun()
+    return _search_tool
 
 
 @function_tool()
@@ -19,17 +32,10 @@ async def search_web(
     query: str,
 ) -> str:
     """Search the web using DuckDuckGo."""
-    # Lazy import - only load when actually searching
-    import asyncio
-
-    from langchain_community.tools import DuckDuckGoSearchRun
+    search_tool = _get_search_tool()
 
-    # Run blocking search in executor to avoid blocking event loop
-    loop = asyncio.get_event_loop()
-    results = await loop.run_in_executor(
-        None, lambda: DuckDuckGoSearchRun().run(tool_input=query)
-    )
-    return results
+    # Run blocking search in a worker thread to avoid blocking event loop
+    return await asyncio.to_thread(search_tool.run, tool_input=query)
 
 
 def _open_in_browser(url: str) -> str:
@@ -133,9 +139,8 @@ async def _get_first_youtube_video_id(
     search_url = f"https://{base_domain}/{search_path}{encoded_query}"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(search_url) as response:
-                html = await response.text()
+        async with get_http_session().get(search_url) as response:
+            html = await response.text()
 
         # Extract first video ID
         video_id_match = re.search(r'"videoId":"([^"]{11})"', html)
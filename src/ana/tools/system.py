@@ -128,26 +128,28 @@ async def shutdown_agent(
     context: RunContext,  # type: ignore
 ) -> str:
     """Shut down the agent and close the terminal window."""
-    cleanup_hardware()
-
-    async def delayed_shutdown():
-        await asyncio.sleep(1.5)
-        logger.info("Executing shutdown sequence - triggering graceful shutdown")
-
-        # Trigger graceful shutdown to run all registered callbacks:
-        # 1. save_conversation_to_mem0 - saves memories
-        # 2. close_terminal_window - closes the terminal
-        try:
-            job_ctx = get_job_context()
-            job_ctx.shutdown(reason="User requested shutdown")
-        except Exception as e:
-            logger.error(f"Could not trigger graceful shutdown: {e}")
-            os._exit(0)
+    await cleanup_hardware()
 
-    asyncio.create_task(delayed_shutdown())
+    # Give the spoken goodbye time to play before the session goes away
+    asyncio.get_running_loop().call_later(1.5, _trigger_shutdown)
     return "✓ Shutting down. Goodbye, Sir."
 
 
+def _trigger_shutdown() -> None:
+    """Shut down the job, or exit the process if there is no job."""
+    logger.info("Executing shutdown sequence - triggering graceful shutdown")
+
+    # Trigger graceful shutdown to run all registered callbacks:
+    # 1. save_conversation_to_mem0 - saves memories
+    # 2. close_terminal_window - closes the terminal
+    try:
+        job_ctx = get_job_context()
+        job_ctx.shutdown(reason="User requested shutdown")
+    except Exception as e:
+        logger.error(f"Could not trigger graceful shutdown: {e}")
+        os._exit(0)
+
+
 async def close_terminal_window():
     """Close the terminal window after shutdown on Windows."""
     if sys.platform != "win32":
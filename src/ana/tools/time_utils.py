@@ -2,12 +2,14 @@
 
 import asyncio
 import logging
-from datetime import datetime
+import time
 
 from livekit.agents import RunContext, function_tool
 
 from .base import handle_tool_error
 
+logger = logging.getLogger(__name__)
+
 
 @function_tool()
 @handle_tool_error("get_current_date")
@@ -15,8 +17,9 @@ async def get_current_date(
     context: RunContext,  # type: ignore
 ) -> str:
     """Get today's date in ISO format (YYYY-MM-DD)."""
-    value = datetime.now().strftime("%Y-%m-%d")
-    logging.info(f"Current date: {value}")
+    value = time.strftime("%Y-%m-%d")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Current date: %s", value)
     return value
 
 
@@ -27,8 +30,9 @@ async def get_current_time(
 ) -> str:
     """Get the current local time in 24-hour format."""
     fmt = "%H:%M"
-    value = datetime.now().strftime(fmt)
-    logging.info(f"Current time: {value}")
+    value = time.strftime(fmt)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Current time: %s", value)
     return value
 
 
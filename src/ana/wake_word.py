@@ -1,21 +1,80 @@
 """Wake word detection module for ANA using Porcupine."""
 
 import atexit
+import functools
 import logging
 import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional, Set
 
 import numpy as np
 import psutil
 import pvporcupine
-import sounddevice as sd
+from pvrecorder import PvRecorder
 
 logger = logging.getLogger(__name__)
 
 _spawned_processes: Set[subprocess.Popen] = set()
+_detectors: "weakref.WeakSet[WakeWordDetector]" = weakref.WeakSet()
+
+# Porcupine handles keyed by (access_key, keyword_path, sensitivity)
+_porcupines: dict[tuple[str, str, float], pvporcupine.Porcupine] = {}
+
+# Launcher executables, resolved once (bare names let Popen report a clear error)
+_UV = shutil.which("uv") or "uv"
+_PNPM = shutil.which("pnpm") or "pnpm"
+
+# How long a process table scan result is reused, in seconds
+_PROCESS_CACHE_TTL = 2.0
+
+# Wake words within this many seconds of a launch are ignored
+_LAUNCH_COOLDOWN = 5.0
+
+# Seconds of audio kept before the wake word for downstream speech recognition
+_PRE_ROLL_SECONDS = 1.5
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_keyword(path: str) -> str:
+    """Resolve and validate a wake word file path once per process."""
+    resolved = Path(path).resolve()
+    if not resolved.exists():
+        raise FileNotFoundError(f"Wake word file not found: {resolved}")
+    return str(resolved)
+
+
+def _get_porcupine(
+    access_key: str, keyword_path: str, sensitivity: float
+) -> pvporcupine.Porcupine:
+    """Get or create a shared Porcupine instance for the given settings."""
+    key = (access_key, keyword_path, sensitivity)
+    porcupine = _porcupines.get(key)
+    if porcupine is None:
+        porcupine = pvporcupine.create(
+            access_key=access_key,
+            keyword_paths=[keyword_path],
+            sensitivities=[sensitivity],
+        )
+        _porcupines[key] = porcupine
+    return porcupine
+
+
+def _release_porcupines():
+    """Delete every cached Porcupine instance."""
+    for porcupine in _porcupines.values():
+        try:
+            porcupine.delete()
+        except Exception as e:
+            logger.warning("Error deleting Porcupine: %s", e)
+    _porcupines.clear()
+    logger.info("Porcupine instances deleted")
 
 
 class WakeWordDetector:
@@ -26,14 +85,22 @@ class WakeWordDetector:
         access_key: str,
         keyword_path: Optional[str] = None,
         sensitivity: Optional[float] = None,
-        on_wake_callback: Optional[Callable] = None,
+        on_wake_callback: Optional[Callable[[np.ndarray], None]] = None,
+        stop_event: Optional[threading.Event] = None,
     ):
-        """Initialize wake word detector."""
+        """Initialize wake word detector.
+
+        ``on_wake_callback`` receives the int16 audio captured just before
+        and including the wake word, oldest sample first. Setting
+        ``stop_event`` makes ``start()`` return, even if it is set before
+        the listen loop begins.
+        """
         from .config import config
 
         self.access_key = access_key
         self.on_wake_callback = on_wake_callback
         self.is_running = False
+        self._stop_event = stop_event if stop_event is not None else threading.Event()
 
         wake_config = config.wake_word
         self.sensitivity = (
@@ -48,44 +115,68 @@ class WakeWordDetector:
                 "keyword_path", "../wake_word/Hey-ANA.ppn"
             )
             keyword_path = project_root / "wake_word" / keyword_filename
-        else:
-            keyword_path = Path(keyword_path)
 
-        if not keyword_path.exists():
-            raise FileNotFoundError(f"Wake word file not found: {keyword_path}")
-
-        self.keyword_path = str(keyword_path)
+        self.keyword_path = _resolve_keyword(str(keyword_path))
         self.porcupine = None
-        self.audio_stream = None
+        self.recorder = None
+        self._ring: Optional[np.ndarray] = None
+        self._ring_pos = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._launching = threading.Event()
+        self._last_launch_ts = float("-inf")
+        self._launch_cooldown = _LAUNCH_COOLDOWN
+        self._ps_cache: dict[tuple[str, ...], tuple[float, bool]] = {}
 
-        atexit.register(self.stop)
+        _detectors.add(self)
 
     def start(self):
         """Start listening for wake word."""
         try:
-            self.porcupine = pvporcupine.create(
-                access_key=self.access_key,
-                keyword_paths=[self.keyword_path],
-                sensitivities=[self.sensitivity],
+            self.porcupine = _get_porcupine(
+                self.access_key, self.keyword_path, self.sensitivity
+            )
+
+            # PvRecorder delivers frames already sized and typed for Porcupine
+            self.recorder = PvRecorder(
+                device_index=-1,
+                frame_length=self.porcupine.frame_length,
+            )
+            self.recorder.start()
+
+            # Ring buffer sized to a whole number of frames so writes never wrap
+            frame_length = self.porcupine.frame_length
+            ring_frames = -(
+                -int(_PRE_ROLL_SECONDS * self.porcupine.sample_rate) // frame_length
             )
+            self._ring = np.zeros(ring_frames * frame_length, dtype=np.int16)
+            self._ring_pos = 0
 
-            self.audio_stream = sd.InputStream(
-                samplerate=self.porcupine.sample_rate,
-                channels=1,
-                dtype=np.int16,
-                blocksize=self.porcupine.frame_length,
+            # Launch work runs here so the audio loop never stalls on it
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="ana-launch"
             )
-            self.audio_stream.start()
+
+            # A stop requested while starting up must not be overwritten
+            stop_requested = self._stop_event.is_set
+            if stop_requested():
+                return
 
             self.is_running = True
             print("🎤 Wake word detector started. Say 'Hey ANA' to activate...")
 
-            while self.is_running:
-                pcm, overflowed = self.audio_stream.read(self.porcupine.frame_length)
-                if overflowed:
-                    logger.warning("Audio buffer overflow detected")
+            # Bind per-frame calls once; the loop runs ~31 times a second
+            read = self.recorder.read
+            process = self.porcupine.process
+            ring = self._ring
+            ring_size = len(ring)
+
+            while self.is_running and not stop_requested():
+                pcm = read()
+                keyword_index = process(pcm)
 
-                keyword_index = self.porcupine.process(pcm.flatten())
+                pos = self._ring_pos
+                ring[pos : pos + frame_length] = pcm
+                self._ring_pos = (pos + frame_length) % ring_size
 
                 if keyword_index >= 0:
                     print("✨ Wake word detected! Activating ANA...")
@@ -104,65 +195,114 @@ class WakeWordDetector:
         """Stop the wake word detector and cleanup resources."""
         self.is_running = False
 
-        if self.audio_stream is not None:
+        if self.recorder is not None:
             try:
-                self.audio_stream.stop()
-                self.audio_stream.close()
-                logger.info("Audio stream closed")
+                self.recorder.stop()
+                self.recorder.delete()
+                logger.info("Audio recorder closed")
             except Exception as e:
-                logger.warning(f"Error closing audio stream: {e}")
+                logger.warning("Error closing audio recorder: %s", e)
             finally:
-                self.audio_stream = None
+                self.recorder = None
 
-        if self.porcupine is not None:
-            try:
-                self.porcupine.delete()
-                logger.info("Porcupine instance deleted")
-            except Exception as e:
-                logger.warning(f"Error deleting Porcupine: {e}")
-            finally:
-                self.porcupine = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        # The Porcupine handle is shared and cached; it is deleted at exit
+        self.porcupine = None
 
     def _handle_wake_word(self):
         """Handle wake word detection."""
         if self.on_wake_callback:
-            self.on_wake_callback()
-        else:
-            self._launch_ana()
+            self.on_wake_callback(self._pre_roll())
+        elif self._executor is not None and not self._launching.is_set():
+            self._launching.set()
+            self._executor.submit(self._run_launch)
+
+    def _pre_roll(self) -> np.ndarray:
+        """Return the buffered audio in chronological order."""
+        return np.concatenate(
+            (self._ring[self._ring_pos :], self._ring[: self._ring_pos])
+        )
 
-    def _is_process_running(self, search_args: list[str]) -> bool:
-        """Check if a process with given command line args is running."""
+    def _run_launch(self):
+        """Launch ANA on the worker thread and clear the in-flight flag."""
         try:
-            for proc in psutil.process_iter(["cmdline"]):
-                cmdline = proc.info.get("cmdline")
-                if cmdline and all(
-                    any(arg in cmd for cmd in cmdline) for arg in search_args
-                ):
-                    return True
-        except Exception:
-            pass
-        return False
+            self._launch_ana()
+        finally:
+            self._launching.clear()
+
+    def _check_processes(self, targets: list[list[str]]) -> list[bool]:
+        """Check which targets have a process running with all their args.
+
+        The process table is walked at most once for all targets, and
+        results are cached for a short time so back-to-back wake events
+        don't walk it again.
+        """
+        now = time.monotonic()
+        keys = [tuple(args) for args in targets]
+        results = [False] * len(keys)
+        pending = []
+        for i, key in enumerate(keys):
+            cached = self._ps_cache.get(key)
+            if cached is not None and now - cached[0] < _PROCESS_CACHE_TTL:
+                results[i] = cached[1]
+            else:
+                pending.append(i)
+
+        if pending:
+            remaining = set(pending)
+            try:
+                for proc in psutil.process_iter(["cmdline"]):
+                    cmdline = proc.info.get("cmdline")
+                    if not cmdline:
+                        continue
+                    joined = " ".join(cmdline)
+                    for i in list(remaining):
+                        if all(arg in joined for arg in keys[i]):
+                            results[i] = True
+                            remaining.discard(i)
+                    if not remaining:
+                        break
+            except Exception:
+                pass
+
+            for i in pending:
+                self._ps_cache[keys[i]] = (now, results[i])
+
+        return results
+
+    def _mark_process_running(self, search_args: list[str]):
+        """Record a freshly spawned process so cached scans don't relaunch it."""
+        self._ps_cache[tuple(search_args)] = (time.monotonic(), True)
 
     def _launch_ana(self):
         """Launch the main ANA backend and UI."""
+        # Ignore repeated triggers (echoed playback, double detections)
+        if time.monotonic() - self._last_launch_ts < self._launch_cooldown:
+            logger.info("Wake word ignored: launch cooldown active")
+            return
+        self._last_launch_ts = time.monotonic()
+
         project_root = Path(__file__).parent.parent.parent
         ui_path = Path.home() / "Desktop" / "ANA" / "ui"
 
+        backend_running, ui_running = self._check_processes(
+            [["main.py"], ["pnpm", "dev"]]
+        )
+
         # Launch backend
-        if not self._is_process_running(["main.py"]):
+        if not backend_running:
             print("🚀 Launching ANA backend...")
             try:
                 backend_process = subprocess.Popen(
-                    [
-                        "powershell",
-                        "-NoExit",
-                        "-Command",
-                        f"cd '{project_root}' ; uv run main.py dev",
-                    ],
-                    shell=True,
-                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
+                    [_UV, "run", "main.py", "dev"],
+                    cwd=str(project_root),
+                    creationflags=subprocess.CREATE_NEW_CONSOLE,
                 )
-                _spawned_processes.add(backend_process)
+                _track_process(backend_process)
+                self._mark_process_running(["main.py"])
                 print("✅ ANA backend launched!")
             except Exception as e:
                 print(f"❌ Failed to launch ANA backend: {e}")
@@ -170,20 +310,16 @@ class WakeWordDetector:
             print("⚠️  ANA backend already running. Skipping launch.")
 
         # Launch UI
-        if not self._is_process_running(["pnpm", "dev"]):
+        if not ui_running:
             print("🌐 Launching ANA UI...")
             try:
                 ui_process = subprocess.Popen(
-                    [
-                        "powershell",
-                        "-NoExit",
-                        "-Command",
-                        f"cd '{ui_path}' ; pnpm run dev",
-                    ],
-                    shell=True,
-                    creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
+                    [_PNPM, "run", "dev"],
+                    cwd=str(ui_path),
+                    creationflags=subprocess.CREATE_NEW_CONSOLE,
                 )
-                _spawned_processes.add(ui_process)
+                _track_process(ui_process)
+                self._mark_process_running(["pnpm", "dev"])
                 print("✅ ANA UI launched!")
             except Exception as e:
                 print(f"❌ Failed to launch ANA UI: {e}")
@@ -191,12 +327,19 @@ class WakeWordDetector:
             print("⚠️  ANA UI already running. Skipping launch.")
 
 
+def _track_process(process: subprocess.Popen):
+    """Remember a spawned process, forgetting any that have already exited."""
+    for old in [p for p in _spawned_processes if p.poll() is not None]:
+        _spawned_processes.discard(old)
+    _spawned_processes.add(process)
+
+
 def cleanup_spawned_processes():
     """Cleanup any spawned ANA processes that are still running."""
     for process in list(_spawned_processes):
         try:
             if process.poll() is None:
-                logger.info(f"Cleaning up spawned process {process.pid}")
+                logger.info("Cleaning up spawned process %s", process.pid)
                 process.terminate()
                 try:
                     process.wait(timeout=5)
@@ -204,10 +347,18 @@ def cleanup_spawned_processes():
                     process.kill()
             _spawned_processes.remove(process)
         except Exception as e:
-            logger.warning(f"Error cleaning up process: {e}")
+            logger.warning("Error cleaning up process: %s", e)
+
+
+def _shutdown_all():
+    """Stop every live detector and clean up spawned processes at exit."""
+    for detector in list(_detectors):
+        detector.stop()
+    _release_porcupines()
+    cleanup_spawned_processes()
 
 
-atexit.register(cleanup_spawned_processes)
+atexit.register(_shutdown_all)
 
 
 def main():
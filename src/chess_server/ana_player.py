@@ -4,15 +4,37 @@ This module provides the integration between the chess server and
 ANA's chess skill, allowing ANA to play as a participant in games.
 """
 
+import functools
 import logging
 import re
+from collections import OrderedDict
 
-from src.ana.tools.chess.skill import analyze_chess_position
+import chess
+
+from src.ana.tools.chess.skill import analyze_chess_position, thinking_pause
 
 from .models import Game, PlayerType
 
 logger = logging.getLogger(__name__)
 
+# ANA's explanation marks its move in bold, e.g. "I'll play **Nf3**."
+# '-' is included so castling (O-O, O-O-O) is parsed too.
+_BOLD_MOVE_RE = re.compile(r"\*\*([A-Za-z0-9+#=-]+)\*\*")
+
+# Analyses remembered across games, keyed by position, difficulty and colour
+_ANALYSIS_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=128)
+def _board_for_fen(fen: str) -> chess.Board:
+    """Parse a FEN once; callers get copies via _board_from_fen."""
+    return chess.Board(fen)
+
+
+def _board_from_fen(fen: str) -> chess.Board:
+    """Get a private board for a FEN without reparsing repeated positions."""
+    return _board_for_fen(fen).copy(stack=False)
+
 
 class ANAPlayer:
     """
@@ -24,8 +46,14 @@ class ANAPlayer:
 
     def __init__(self):
         self._thinking = False
-
-    async def get_move(self, game: Game, player_color: str | None = None) -> dict:
+        self._analysis_cache: OrderedDict[tuple, str] = OrderedDict()
+
+    async def get_move(
+        self,
+        game: Game,
+        player_color: str | None = None,
+        board: chess.Board | None = None,
+    ) -> dict:
         """
         Get ANA's move for the current game position.
 
@@ -33,10 +61,13 @@ class ANAPlayer:
             game: The current game state
             player_color: Optional override for which color to play/analyze as.
                          If None, infers from game settings where ANA is a player.
+            board: Optional live board for the game, used to parse ANA's move
+                   without rebuilding the position from FEN.
 
         Returns:
             dict with:
                 - move: UCI format move string
+                - move_obj: chess.Move parsed against ``board`` (or None)
                 - explanation: Natural language explanation
                 - success: bool
         """
@@ -51,9 +82,9 @@ class ANAPlayer:
         try:
             # Determine which color ANA is playing if not specified
             if player_color is None:
-                if game.white.type == PlayerType.ANA:
+                if game.white.type is PlayerType.ANA:
                     player_color = "white"
-                elif game.black.type == PlayerType.ANA:
+                elif game.black.type is PlayerType.ANA:
                     player_color = "black"
                 else:
                     return {
@@ -66,18 +97,37 @@ class ANAPlayer:
                 f"difficulty={game.difficulty})"
             )
 
-            # Call the chess skill (includes thinking delay)
-            explanation = await analyze_chess_position(
-                fen=game.fen,
-                player_color=player_color,
-                difficulty=game.difficulty,
-            )
+            live_board = board is not None
+            if board is None:
+                board = _board_from_fen(game.fen)
+            cache_key = (board._transposition_key(), game.difficulty, player_color)
+
+            explanation = self._analysis_cache.get(cache_key)
+            if explanation is None:
+                # Call the chess skill (includes thinking delay)
+                explanation = await analyze_chess_position(
+                    fen=game.fen,
+                    player_color=player_color,
+                    difficulty=game.difficulty,
+                )
+            else:
+                # Seen this position before: skip the engine, keep the pacing
+                self._analysis_cache.move_to_end(cache_key)
+                await thinking_pause(game.difficulty)
+
+            # A live board can change while ANA thinks (e.g. in ghost mode);
+            # only cache the analysis under the position it was made for
+            position_unchanged = board._transposition_key() == cache_key[0]
 
             # Extract the move from the explanation
             # The skill returns something like "I'll play **e4**. The position is..."
-            move = self._extract_move_from_explanation(explanation, game.fen)
+            move_obj = self._extract_move_from_explanation(explanation, board)
 
-            if not move:
+            if move_obj:
+                move = move_obj.uci()
+                if position_unchanged:
+                    self._remember_analysis(cache_key, explanation)
+            else:
                 # Fallback: get just the move
                 from src.ana.tools.chess.skill import get_chess_move
 
@@ -88,6 +138,8 @@ class ANAPlayer:
             return {
                 "success": True,
                 "move": move,
+                # Only a move parsed against the live board is validated for it
+                "move_obj": move_obj if live_board else None,
                 "explanation": explanation,
             }
 
@@ -101,32 +153,42 @@ class ANAPlayer:
         finally:
             self._thinking = False
 
-    def _extract_move_from_explanation(self, explanation: str, fen: str) -> str | None:
+    def _remember_analysis(self, key: tuple, explanation: str) -> None:
+        """Store an analysis, evicting the least recently used when full."""
+        self._analysis_cache[key] = explanation
+        self._analysis_cache.move_to_end(key)
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+
+    def _extract_move_from_explanation(
+        self, explanation: str, board: chess.Board
+    ) -> chess.Move | None:
         """
-        Extract UCI move from the explanation text.
+        Extract ANA's move from the explanation text.
 
         The explanation format is typically:
         "I'll play **Nf3**. Some explanation..."
 
-        We need to convert SAN to UCI using the current position.
+        The SAN is parsed against the current position, which also checks
+        that it is legal there. parse_san does not modify the board, so the
+        live board can be used.
         """
-        import chess
-
         # Look for move in bold (**move**)
-        match = re.search(r"\*\*([A-Za-z0-9+#=]+)\*\*", explanation)
+        match = _BOLD_MOVE_RE.search(explanation)
         if not match:
             return None
 
         san_move = match.group(1)
 
         try:
-            board = chess.Board(fen)
             move = board.parse_san(san_move)
-            return move.uci()
         except (ValueError, chess.InvalidMoveError, chess.AmbiguousMoveError) as e:
             logger.warning(f"Could not parse SAN move '{san_move}': {e}")
             return None
 
+        # parse_san accepts null moves ("--"), which are never a real move
+        return move or None
+
     @property
     def is_thinking(self) -> bool:
         """Check if ANA is currently thinking."""
@@ -5,15 +5,19 @@ The server is the single source of truth for game state.
 """
 
 import logging
-import uuid
-from typing import Callable
+import secrets
+import time
+from typing import Callable, Hashable
 
 import chess
 
-from .models import Game, GameStatus, Player
+from .models import ChatMessage, Game, GameStatus, Player
 
 logger = logging.getLogger(__name__)
 
+# (checkmate, stalemate, insufficient_material, check) for a position
+_TerminalFlags = tuple[bool, bool, bool, bool]
+
 
 class GameManager:
     """
@@ -23,8 +27,15 @@ class GameManager:
     """
 
     def __init__(self):
+        # Each game carries its own board (built on first use), so a single
+        # lookup here finds both
         self.games: dict[str, Game] = {}
-        self.boards: dict[str, chess.Board] = {}
+        # Per-game terminal flags keyed by position (board._transposition_key())
+        self._term_cache: dict[str, dict[Hashable, _TerminalFlags]] = {}
+        # Per-game (position key, legal UCI moves) for the last position queried
+        self._legal_cache: dict[str, tuple[Hashable, tuple[str, ...]]] = {}
+        # IDs of FINISHED/ABANDONED games awaiting cleanup
+        self._finished_ids: set[str] = set()
         self._on_game_end_callbacks: list[Callable] = []
 
     def create_game(
@@ -44,7 +55,7 @@ class GameManager:
         Returns:
             The newly created Game
         """
-        game_id = str(uuid.uuid4())
+        game_id = secrets.token_hex(16)
         game = Game(
             id=game_id,
             white=white,
@@ -53,7 +64,6 @@ class GameManager:
             difficulty=difficulty,
         )
         self.games[game_id] = game
-        self.boards[game_id] = chess.Board()
 
         logger.info(f"Created game {game_id}: {white.name} vs {black.name}")
         return game
@@ -62,6 +72,26 @@ class GameManager:
         """Get a game by ID."""
         return self.games.get(game_id)
 
+    def get_board(self, game_id: str) -> chess.Board | None:
+        """Get the authoritative board for a game by ID."""
+        return self._get_or_create_board(game_id)
+
+    def _get_or_create_board(self, game_id: str) -> chess.Board | None:
+        """Get the board for a game ID, or None if the game doesn't exist."""
+        game = self.games.get(game_id)
+        if game is None:
+            return None
+        return self._board_of(game)
+
+    @staticmethod
+    def _board_of(game: Game) -> chess.Board:
+        """Get a game's board, building it from the game's FEN on first use."""
+        board = game.board
+        if board is None:
+            board = chess.Board(game.fen)
+            game.mark_board_changed(board)
+        return board
+
     def make_move(self, game_id: str, move_uci: str) -> dict:
         """
         Attempt to make a move in a game.
@@ -80,29 +110,60 @@ class GameManager:
                 - result: game result if over
         """
         game = self.games.get(game_id)
-        board = self.boards.get(game_id)
 
-        if not game or not board:
+        if not game:
             return {"success": False, "error": "Game not found"}
 
-        if game.status != GameStatus.ACTIVE:
+        if game.status is not GameStatus.ACTIVE:
             return {"success": False, "error": "Game is not active"}
 
+        board = self._board_of(game)
+
         try:
             move = chess.Move.from_uci(move_uci)
         except ValueError:
             return {"success": False, "error": f"Invalid move format: {move_uci}"}
 
-        if move not in board.legal_moves:
+        if not board.is_legal(move):
             return {"success": False, "error": f"Illegal move: {move_uci}"}
 
-        # Make the move
-        san = board.san(move)
-        board.push(move)
+        return self._apply_move(game_id, game, board, move)
+
+    def make_move_obj(self, game_id: str, move: chess.Move) -> dict:
+        """
+        Make an already-validated move in a game.
+
+        The move must have been generated or parsed (e.g. via parse_san)
+        against this game's current board, so format and legality checks
+        are skipped. Returns the same dict as make_move.
+        """
+        game = self.games.get(game_id)
+
+        if not game:
+            return {"success": False, "error": "Game not found"}
+
+        if game.status is not GameStatus.ACTIVE:
+            return {"success": False, "error": "Game is not active"}
+
+        board = self._board_of(game)
+        return self._apply_move(game_id, game, board, move)
+
+    def _apply_move(
+        self,
+        game_id: str,
+        game: Game,
+        board: chess.Board,
+        move: chess.Move,
+    ) -> dict:
+        """Push a legal move and update game state and end conditions."""
+        move_uci = move.uci()
+
+        # Make the move (computes SAN and pushes in one pass)
+        san = board.san_and_push(move)
 
         # Update game state
-        game.fen = board.fen()
-        game.moves.append(move_uci)
+        game.mark_board_changed(board)
+        game.record_move(move)
 
         result = {
             "success": True,
@@ -113,53 +174,96 @@ class GameManager:
         }
 
         # Check for game end conditions
-        if board.is_checkmate():
+        checkmate, stalemate, insufficient, in_check = self._terminal_flags(
+            game_id, board
+        )
+
+        if checkmate:
             game.status = GameStatus.FINISHED
             game.winner = "black" if board.turn else "white"
             result["game_over"] = True
             result["result"] = f"Checkmate! {game.winner.capitalize()} wins!"
             logger.info(f"Game {game_id} ended: {result['result']}")
 
-        elif board.is_stalemate():
+        elif stalemate:
             game.status = GameStatus.FINISHED
             game.winner = "draw"
             result["game_over"] = True
             result["result"] = "Stalemate - Draw!"
             logger.info(f"Game {game_id} ended: Stalemate")
 
-        elif board.is_insufficient_material():
+        elif insufficient:
             game.status = GameStatus.FINISHED
             game.winner = "draw"
             result["game_over"] = True
             result["result"] = "Draw by insufficient material"
             logger.info(f"Game {game_id} ended: Insufficient material")
 
-        elif board.can_claim_draw():
-            # Could implement draw offers here
-            pass
+        # Draw claims (threefold repetition, fifty moves) could be offered here
 
-        if board.is_check() and not result.get("game_over"):
+        if result["game_over"]:
+            self._mark_finished(game)
+        elif in_check:
             result["check"] = True
 
         return result
 
+    def _terminal_flags(self, game_id: str, board: chess.Board) -> _TerminalFlags:
+        """Get game-end flags for the board's position, computing them once."""
+        cache = self._term_cache.setdefault(game_id, {})
+        key = board._transposition_key()
+        flags = cache.get(key)
+        if flags is None:
+            # One probe for any legal move covers both checkmate and stalemate
+            in_check = board.is_check()
+            has_legal = any(True for _ in board.generate_legal_moves())
+            flags = (
+                not has_legal and in_check,
+                not has_legal and not in_check,
+                has_legal and board.is_insufficient_material(),
+                in_check,
+            )
+            cache[key] = flags
+        return flags
+
+    def _mark_finished(self, game: Game) -> None:
+        """Record that a game ended and release its per-game caches."""
+        game.invalidate_dict()
+        self._finished_ids.add(game.id)
+        self._evict_caches(game.id)
+
+    def _evict_caches(self, game_id: str) -> None:
+        """Drop per-game caches once a game can no longer change."""
+        self._term_cache.pop(game_id, None)
+        self._legal_cache.pop(game_id, None)
+
     def get_legal_moves(self, game_id: str) -> list[str]:
         """Get all legal moves in UCI format for the current position."""
-        board = self.boards.get(game_id)
+        board = self._get_or_create_board(game_id)
         if not board:
             return []
-        return [move.uci() for move in board.legal_moves]
+
+        # Finished games were evicted already; don't cache for them again
+        if game_id in self._finished_ids:
+            return list(map(chess.Move.uci, board.generate_legal_moves()))
+
+        key = board._transposition_key()
+        cached = self._legal_cache.get(game_id)
+        if cached is None or cached[0] != key:
+            cached = (key, tuple(map(chess.Move.uci, board.generate_legal_moves())))
+            self._legal_cache[game_id] = cached
+        return list(cached[1])
 
     def get_current_turn(self, game_id: str) -> str:
         """Get whose turn it is ('white' or 'black')."""
-        board = self.boards.get(game_id)
+        board = self._get_or_create_board(game_id)
         if not board:
             return "white"
         return "white" if board.turn else "black"
 
     def is_game_over(self, game_id: str) -> bool:
         """Check if the game is over."""
-        board = self.boards.get(game_id)
+        board = self._get_or_create_board(game_id)
         if not board:
             return False
         return board.is_game_over()
@@ -178,6 +282,7 @@ class GameManager:
             return {"success": False, "error": "Player not in this game"}
 
         game.status = GameStatus.FINISHED
+        self._mark_finished(game)
         return {
             "success": True,
             "result": f"{game.winner.capitalize()} wins by resignation!",
@@ -188,6 +293,7 @@ class GameManager:
         game = self.games.get(game_id)
         if game:
             game.status = GameStatus.ABANDONED
+            self._mark_finished(game)
             logger.info(f"Game {game_id} abandoned")
 
     def add_chat_message(
@@ -196,20 +302,18 @@ class GameManager:
         sender_id: str,
         sender_name: str,
         message: str,
-    ) -> dict | None:
+    ) -> ChatMessage | None:
         """Add a chat message to a game."""
-        import time
-
         game = self.games.get(game_id)
         if not game:
             return None
 
-        chat_msg = {
-            "sender": sender_id,
-            "senderName": sender_name,
-            "message": message,
-            "timestamp": time.time(),
-        }
+        chat_msg = ChatMessage(
+            sender=sender_id,
+            sender_name=sender_name,
+            message=message,
+            timestamp=time.time(),
+        )
         game.chat_messages.append(chat_msg)
         return chat_msg
 
@@ -217,14 +321,13 @@ class GameManager:
         """Remove finished games older than max_age_seconds."""
         removed = 0
 
-        for game_id in list(self.games.keys()):
-            game = self.games[game_id]
-            if game.status in (GameStatus.FINISHED, GameStatus.ABANDONED):
-                # For simplicity, remove all finished games
-                # In production, track game end time
-                del self.games[game_id]
-                del self.boards[game_id]
+        # For simplicity, remove all finished games
+        # In production, track game end time
+        for game_id in self._finished_ids:
+            self._evict_caches(game_id)
+            if self.games.pop(game_id, None) is not None:
                 removed += 1
+        self._finished_ids.clear()
 
         if removed:
             logger.info(f"Cleaned up {removed} finished games")
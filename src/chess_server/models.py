@@ -1,27 +1,46 @@
 """Data models for the chess game server."""
 
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
+import chess
 
-class PlayerType(str, Enum):
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Chat messages kept per game; older ones are dropped
+MAX_CHAT_MESSAGES = 200
+
+
+class PlayerType(IntEnum):
     """Type of player in a chess game."""
 
-    HUMAN = "human"
-    ANA = "ana"
+    HUMAN = 0
+    ANA = 1
 
 
-class GameStatus(str, Enum):
+class GameStatus(IntEnum):
     """Status of a chess game."""
 
-    WAITING = "waiting"  # Waiting for second player
-    ACTIVE = "active"  # Game in progress
-    FINISHED = "finished"  # Game ended
-    ABANDONED = "abandoned"  # Player disconnected
+    WAITING = 0  # Waiting for second player
+    ACTIVE = 1  # Game in progress
+    FINISHED = 2  # Game ended
+    ABANDONED = 3  # Player disconnected
+
 
+# Wire names for the enums; clients only ever see these strings
+_PLAYER_TYPE_STR = {PlayerType.HUMAN: "human", PlayerType.ANA: "ana"}
+_GAME_STATUS_STR = {
+    GameStatus.WAITING: "waiting",
+    GameStatus.ACTIVE: "active",
+    GameStatus.FINISHED: "finished",
+    GameStatus.ABANDONED: "abandoned",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class Player:
     """Represents a player in a chess game."""
 
@@ -35,55 +54,127 @@ class Player:
         return {
             "id": self.id,
             "name": self.name,
-            "type": self.type.value,
+            "type": _PLAYER_TYPE_STR[self.type],
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
     """Represents a chess game with all its state."""
 
     id: str
     white: Player
     black: Player
-    fen: str = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
-    moves: list[str] = field(default_factory=list)
+    # Packed moves: from | to << 6 | promotion << 12 (see record_move)
+    moves: array = field(default_factory=lambda: array("H"))
     status: GameStatus = GameStatus.WAITING
     winner: str | None = None  # "white", "black", or "draw"
-    chat_messages: list[dict] = field(default_factory=list)
+    chat_messages: deque["ChatMessage"] = field(
+        default_factory=lambda: deque(maxlen=MAX_CHAT_MESSAGES)
+    )
     difficulty: str = "medium"
+    # FEN is serialized from the board lazily, only when it is read
+    _fen_cache: str = field(default=STARTING_FEN, repr=False)
+    _fen_dirty: bool = field(default=False, repr=False)
+    _board: Any = field(default=None, repr=False)  # chess.Board
+    # Player types never change once seated (joining only fills a human slot)
+    _white_is_ana: bool = field(default=False, init=False, repr=False)
+    _black_is_ana: bool = field(default=False, init=False, repr=False)
+    # Open WebSockets of the human players, kept up to date by the server
+    targets: list[Any] = field(default_factory=list, repr=False, compare=False)
+    # Last to_dict() result; cleared by invalidate_dict() when state changes
+    _dict_cache: dict | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._white_is_ana = self.white.type is PlayerType.ANA
+        self._black_is_ana = self.black.type is PlayerType.ANA
+
+    @property
+    def fen(self) -> str:
+        """Current position in FEN, serialized from the board on demand."""
+        if self._fen_dirty:
+            self._fen_cache = self._board.fen()
+            self._fen_dirty = False
+        return self._fen_cache
+
+    @fen.setter
+    def fen(self, value: str) -> None:
+        self._fen_cache = value
+        self._fen_dirty = False
+        self._dict_cache = None
+
+    @property
+    def board(self) -> Any:
+        """The game's chess.Board, or None until the manager first needs it."""
+        return self._board
+
+    def mark_board_changed(self, board: Any) -> None:
+        """Record that the board moved so the FEN is re-serialized on next read."""
+        self._board = board
+        self._fen_dirty = True
+        self._dict_cache = None
+
+    def record_move(self, move: chess.Move) -> None:
+        """Append a move to the history as a packed 16-bit code."""
+        self.moves.append(
+            move.from_square | move.to_square << 6 | (move.promotion or 0) << 12
+        )
+        self._dict_cache = None
+
+    def moves_uci(self) -> list[str]:
+        """Decode the move history to UCI strings."""
+        return [
+            chess.Move(code & 0x3F, code >> 6 & 0x3F, code >> 12 or None).uci()
+            for code in self.moves
+        ]
+
+    def invalidate_dict(self) -> None:
+        """Drop the cached to_dict() result after changing players or status."""
+        self._dict_cache = None
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "white": self.white.to_dict(),
-            "black": self.black.to_dict(),
-            "fen": self.fen,
-            "moves": self.moves,
-            "status": self.status.value,
-            "winner": self.winner,
-            "difficulty": self.difficulty,
-        }
+        """Convert to dictionary for JSON serialization.
+
+        The result is cached until the game changes, so callers must not
+        modify it.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "id": self.id,
+                "white": self.white.to_dict(),
+                "black": self.black.to_dict(),
+                "fen": self.fen,
+                "moves": self.moves_uci(),
+                "status": _GAME_STATUS_STR[self.status],
+                "winner": self.winner,
+                "difficulty": self.difficulty,
+            }
+        return self._dict_cache
 
     @property
     def current_turn(self) -> str:
         """Get whose turn it is based on FEN."""
         # FEN format: position activeColor castling enPassant halfmove fullmove
-        parts = self.fen.split()
-        if len(parts) >= 2:
-            return "white" if parts[1] == "w" else "black"
-        return "white"
+        fen = self.fen
+        try:
+            return "white" if fen[fen.index(" ") + 1] == "w" else "black"
+        except (ValueError, IndexError):
+            return "white"
 
     @property
     def is_ana_turn(self) -> bool:
         """Check if it's ANA's turn to move."""
-        if self.current_turn == "white":
-            return self.white.type == PlayerType.ANA
-        return self.black.type == PlayerType.ANA
+        fen = self.fen
+        try:
+            white_to_move = fen[fen.index(" ") + 1] == "w"
+        except (ValueError, IndexError):
+            white_to_move = True
+        return self._white_is_ana if white_to_move else self._black_is_ana
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     """A chat message in the game."""
 
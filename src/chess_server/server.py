@@ -8,19 +8,34 @@ This server handles:
 """
 
 import asyncio
-import json
 import logging
-import uuid
+import secrets
 from typing import Any
 
+import orjson
 from aiohttp import WSMsgType, web
 
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+
 from .ana_player import ANAPlayer
 from .game_manager import GameManager
-from .models import Game, GameStatus, Player, PlayerType
+from .models import ChatMessage, Game, GameStatus, Player, PlayerType
 
 logger = logging.getLogger(__name__)
 
+# ANAPlayer analyses one position at a time, so one worker drains the queue
+_ANA_WORKERS = 1
+
+# Frames that are constant, or vary only by a hex ID, encoded once up front
+_CONNECTED_PREFIX = b'{"type":"connected","playerId":"'
+_ANA_THINKING_PREFIX = b'{"type":"ana_thinking","gameId":"'
+_ID_SUFFIX = b'"}'
+_ANA_THINKING_LOCAL_FRAME = orjson.dumps({"type": "ana_thinking_local"})
+_INVALID_JSON_FRAME = orjson.dumps({"type": "error", "message": "Invalid JSON"})
+
 
 class ChessServer:
     """
@@ -36,6 +51,24 @@ class ChessServer:
         self.ana_player = ANAPlayer()
         self.connections: dict[str, web.WebSocketResponse] = {}  # player_id -> ws
         self.player_games: dict[str, str] = {}  # player_id -> game_id
+        # game_id -> messages waiting to go out in the next batch frame
+        self._pending: dict[str, list[dict]] = {}
+        # Running flush tasks, held so they are not garbage collected
+        self._flush_tasks: set[asyncio.Task] = set()
+        # Games waiting for ANA to move, drained by the ANA worker tasks
+        self._ana_queue: asyncio.Queue[Game] = asyncio.Queue()
+        self._ana_workers: list[asyncio.Task] = []
+        self._ana_queued: set[str] = set()  # ids of games waiting in _ana_queue
+        # Message type -> handler, built once instead of per message
+        self._handlers = {
+            "create_game": self._handle_create_game,
+            "join_game": self._handle_join_game,
+            "move": self._handle_move,
+            "resign": self._handle_resign,
+            "chat": self._handle_chat,
+            "get_game_state": self._handle_get_game_state,
+            "request_ana_move": self._handle_request_ana_move,
+        }
         self._app: web.Application | None = None
         self._runner: web.AppRunner | None = None
 
@@ -53,10 +86,25 @@ class ChessServer:
         site = web.TCPSite(self._runner, self.host, self.port)
         await site.start()
 
+        self._ana_workers = [
+            asyncio.create_task(self._ana_worker()) for _ in range(_ANA_WORKERS)
+        ]
+
         logger.info(f"Chess server started at ws://{self.host}:{self.port}/ws")
 
     async def stop(self):
         """Stop the server."""
+        for worker in self._ana_workers:
+            worker.cancel()
+        await asyncio.gather(*self._ana_workers, return_exceptions=True)
+        self._ana_workers = []
+
+        for task in self._flush_tasks:
+            task.cancel()
+        await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        self._flush_tasks.clear()
+        self._pending.clear()
+
         if self._runner:
             await self._runner.cleanup()
         logger.info("Chess server stopped")
@@ -64,12 +112,15 @@ class ChessServer:
     async def handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint with game list."""
         games_list = [g.to_dict() for g in self.game_manager.games.values()]
-        return web.json_response(
-            {
-                "status": "ok",
-                "games_count": len(games_list),
-                "games": games_list,
-            }
+        return web.Response(
+            body=orjson.dumps(
+                {
+                    "status": "ok",
+                    "games_count": len(games_list),
+                    "games": games_list,
+                }
+            ),
+            content_type="application/json",
         )
 
     async def handle_get_game_api(self, request: web.Request) -> web.Response:
@@ -99,21 +150,14 @@ class ChessServer:
 
             # Add chat message if explanation provided
             if explanation:
-                self.game_manager.add_chat_message(game_id, "ana", "ANA", explanation)
-                # Broadcast chat
-                await self._broadcast(
-                    game,
-                    {
-                        "type": "chat",
-                        "gameId": game.id,
-                        "sender": "ana",
-                        "senderName": "ANA",
-                        "message": explanation,
-                    },
+                chat_msg = self.game_manager.add_chat_message(
+                    game_id, "ana", "ANA", explanation
                 )
+                # Broadcast chat
+                self._queue(game, self._chat_payload(game.id, chat_msg))
 
             # Broadcast update to UI
-            await self._broadcast_game_state(game, move_result=result)
+            self._queue(game, self._game_state_message(game, move_result=result))
 
             return web.json_response({"status": "ok", "result": result})
 
@@ -123,48 +167,39 @@ class ChessServer:
 
     async def handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
         """Handle a new WebSocket connection."""
-        ws = web.WebSocketResponse()
+        # permessage-deflate, when the client offers it (browsers do); frames
+        # stay text because the UI JSON.parses them
+        ws = web.WebSocketResponse(compress=True)
         await ws.prepare(request)
 
-        player_id = str(uuid.uuid4())
+        player_id = secrets.token_hex(8)
         self.connections[player_id] = ws
 
-        logger.info(f"New connection: {player_id}")
+        logger.info("New connection: %s", player_id)
 
         # Send welcome message with player ID
-        await self._send(
-            ws,
-            {
-                "type": "connected",
-                "playerId": player_id,
-            },
-        )
+        await self._send(ws, _CONNECTED_PREFIX + player_id.encode() + _ID_SUFFIX)
 
         try:
             async for msg in ws:
                 if msg.type == WSMsgType.TEXT:
                     try:
-                        data = json.loads(msg.data)
+                        data = orjson.loads(msg.data)
                         await self._handle_message(player_id, ws, data)
-                    except json.JSONDecodeError:
-                        await self._send(
-                            ws,
-                            {
-                                "type": "error",
-                                "message": "Invalid JSON",
-                            },
-                        )
+                    except orjson.JSONDecodeError:
+                        await self._send(ws, _INVALID_JSON_FRAME)
                 elif msg.type == WSMsgType.ERROR:
-                    logger.error(f"WebSocket error: {ws.exception()}")
+                    logger.error("WebSocket error: %s", ws.exception())
 
         except Exception as e:
-            logger.error(f"Connection error: {e}")
+            logger.error("Connection error: %s", e)
 
         finally:
-            # Cleanup on disconnect
-            await self._handle_disconnect(player_id)
+            # Unregister before anything awaits, so no broadcast targets the
+            # closed socket
             del self.connections[player_id]
-            logger.info(f"Connection closed: {player_id}")
+            await self._handle_disconnect(player_id, ws)
+            logger.info("Connection closed: %s", player_id)
 
         return ws
 
@@ -177,17 +212,7 @@ class ChessServer:
         """Route incoming messages to handlers."""
         msg_type = data.get("type")
 
-        handlers = {
-            "create_game": self._handle_create_game,
-            "join_game": self._handle_join_game,
-            "move": self._handle_move,
-            "resign": self._handle_resign,
-            "chat": self._handle_chat,
-            "get_game_state": self._handle_get_game_state,
-            "request_ana_move": self._handle_request_ana_move,
-        }
-
-        handler = handlers.get(msg_type)
+        handler = self._handlers.get(msg_type)
         if handler:
             await handler(player_id, ws, data)
         else:
@@ -221,9 +246,7 @@ class ChessServer:
 
         # Determine colors
         if player_color == "random":
-            import random
-
-            player_color = random.choice(["white", "black"])
+            player_color = "white" if secrets.randbits(1) else "black"
 
         # Create opponent
         if opponent_type == "ana":
@@ -246,11 +269,12 @@ class ChessServer:
                 black = human_player
 
         game = self.game_manager.create_game(white, black, difficulty)
-        self.player_games[player_id] = game.id
+        self._set_player_game(player_id, ws, game)
 
         # If waiting for human opponent, set status
         if opponent_type == "human" and (not white.id or not black.id):
             game.status = GameStatus.WAITING
+            game.invalidate_dict()
 
         await self._send(
             ws,
@@ -262,8 +286,8 @@ class ChessServer:
         )
 
         # If it's ANA's turn (playing white), trigger ANA's move
-        if game.is_ana_turn and game.status == GameStatus.ACTIVE:
-            asyncio.create_task(self._trigger_ana_move(game))
+        if game.is_ana_turn and game.status is GameStatus.ACTIVE:
+            self._trigger_ana_move(game)
 
     async def _handle_join_game(
         self,
@@ -286,7 +310,7 @@ class ChessServer:
             )
             return
 
-        if game.status != GameStatus.WAITING:
+        if game.status is not GameStatus.WAITING:
             await self._send(
                 ws,
                 {
@@ -312,7 +336,8 @@ class ChessServer:
             your_color = "black"
 
         game.status = GameStatus.ACTIVE
-        self.player_games[player_id] = game.id
+        game.invalidate_dict()
+        self._set_player_game(player_id, ws, game)
 
         # Notify joiner
         await self._send(
@@ -371,56 +396,79 @@ class ChessServer:
 
         # If game continues and it's now ANA's turn, trigger ANA
         if not result.get("game_over") and game.is_ana_turn:
-            asyncio.create_task(self._trigger_ana_move(game))
+            self._trigger_ana_move(game)
+
+    def _trigger_ana_move(self, game: Game):
+        """Queue a game for ANA to make a move."""
+        if game.id in self._ana_queued:
+            return
+        self._ana_queued.add(game.id)
+        self._ana_queue.put_nowait(game)
 
-    async def _trigger_ana_move(self, game: Game):
-        """Trigger ANA to make a move."""
+    async def _ana_worker(self):
+        """Make ANA's moves for queued games, one at a time."""
+        while True:
+            game = await self._ana_queue.get()
+            self._ana_queued.discard(game.id)
+            try:
+                # The game may have ended or moved on while it waited in the queue
+                if game.status is GameStatus.ACTIVE and game.is_ana_turn:
+                    await self._run_ana_move(game)
+            except Exception as e:
+                logger.error("ANA move failed for game %s: %s", game.id, e)
+            finally:
+                self._ana_queue.task_done()
+
+    async def _run_ana_move(self, game: Game):
+        """Have ANA think about and play a move."""
         # Small delay before ANA starts thinking (more natural)
         await asyncio.sleep(0.5)
 
         # Notify players ANA is thinking
         await self._broadcast(
-            game,
-            {
-                "type": "ana_thinking",
-                "gameId": game.id,
-            },
+            game, _ANA_THINKING_PREFIX + game.id.encode() + _ID_SUFFIX
         )
 
         # Get ANA's move
-        result = await self.ana_player.get_move(game)
+        fen = game.fen
+        result = await self.ana_player.get_move(
+            game, board=self.game_manager.get_board(game.id)
+        )
+
+        # Someone else may have moved while ANA was thinking
+        if game.fen != fen or game.status is not GameStatus.ACTIVE:
+            logger.info("Game %s changed while ANA was thinking", game.id)
+            return
 
         if result["success"]:
             # Make the move on the board
-            move_result = self.game_manager.make_move(game.id, result["move"])
+            move_result = self._apply_ana_move(game, result)
 
             if move_result["success"]:
                 # Add ANA's explanation as a chat message
-                self.game_manager.add_chat_message(
+                chat_msg = self.game_manager.add_chat_message(
                     game.id,
                     "ana",
                     "ANA",
                     result["explanation"],
                 )
 
-                # Broadcast updated state
-                await self._broadcast_game_state(game, move_result=move_result)
-
-                # Also broadcast the chat message
-                await self._broadcast(
-                    game,
-                    {
-                        "type": "chat",
-                        "gameId": game.id,
-                        "sender": "ana",
-                        "senderName": "ANA",
-                        "message": result["explanation"],
-                    },
+                # Broadcast updated state and the chat message in one frame
+                self._queue(
+                    game, self._game_state_message(game, move_result=move_result)
                 )
+                self._queue(game, self._chat_payload(game.id, chat_msg))
             else:
-                logger.error(f"ANA's move failed validation: {move_result['error']}")
+                logger.error("ANA's move failed validation: %s", move_result["error"])
         else:
-            logger.error(f"ANA failed to generate move: {result.get('error')}")
+            logger.error("ANA failed to generate move: %s", result.get("error"))
+
+    def _apply_ana_move(self, game: Game, result: dict) -> dict:
+        """Apply ANA's move, skipping revalidation when it was parsed live."""
+        move_obj = result.get("move_obj")
+        if move_obj is not None:
+            return self.game_manager.make_move_obj(game.id, move_obj)
+        return self.game_manager.make_move(game.id, result["move"])
 
     async def _handle_resign(
         self,
@@ -466,19 +514,12 @@ class ChessServer:
         else:
             sender_name = "Unknown"
 
-        self.game_manager.add_chat_message(game_id, player_id, sender_name, message)
-
-        await self._broadcast(
-            game,
-            {
-                "type": "chat",
-                "gameId": game_id,
-                "sender": player_id,
-                "senderName": sender_name,
-                "message": message,
-            },
+        chat_msg = self.game_manager.add_chat_message(
+            game_id, player_id, sender_name, message
         )
 
+        await self._broadcast(game, self._chat_payload(game_id, chat_msg))
+
     async def _handle_get_game_state(
         self,
         player_id: str,
@@ -527,14 +568,18 @@ class ChessServer:
             return  # Not your turn
 
         # Notify requester ONLY that ANA is thinking
-        await self._send(ws, {"type": "ana_thinking_local"})
+        await self._send(ws, _ANA_THINKING_LOCAL_FRAME)
 
         # Get ANA's move
-        result = await self.ana_player.get_move(game, player_color=player_color)
+        result = await self.ana_player.get_move(
+            game,
+            player_color=player_color,
+            board=self.game_manager.get_board(game.id),
+        )
 
         if result["success"]:
             # Make the move on the board
-            move_result = self.game_manager.make_move(game.id, result["move"])
+            move_result = self._apply_ana_move(game, result)
 
             if move_result["success"]:
                 # Broadcast updated state (Look like a normal move)
@@ -563,12 +608,22 @@ class ChessServer:
                 ws, {"type": "error", "message": "ANA failed to find move"}
             )
 
-    async def _handle_disconnect(self, player_id: str):
+    def _set_player_game(self, player_id: str, ws: web.WebSocketResponse, game: Game):
+        """Make game the player's current one; the socket only gets its updates."""
+        previous = self.game_manager.get_game(self.player_games.get(player_id, ""))
+        if previous and ws in previous.targets:
+            previous.targets.remove(ws)
+        game.targets.append(ws)
+        self.player_games[player_id] = game.id
+
+    async def _handle_disconnect(self, player_id: str, ws: web.WebSocketResponse):
         """Handle player disconnect."""
         game_id = self.player_games.get(player_id)
         if game_id:
             game = self.game_manager.get_game(game_id)
-            if game and game.status == GameStatus.ACTIVE:
+            if game and ws in game.targets:
+                game.targets.remove(ws)
+            if game and game.status is GameStatus.ACTIVE:
                 # For now, abandon the game
                 self.game_manager.abandon_game(game_id)
                 await self._broadcast(
@@ -581,12 +636,22 @@ class ChessServer:
                 )
             del self.player_games[player_id]
 
+    @staticmethod
+    def _chat_payload(game_id: str, chat_msg: ChatMessage) -> dict:
+        """Build the chat WebSocket message for a stored chat message."""
+        return {"type": "chat", "gameId": game_id, **chat_msg.to_dict()}
+
     async def _broadcast_game_state(
         self,
         game: Game,
         move_result: dict | None = None,
     ):
         """Broadcast game state to all players in a game."""
+        await self._broadcast(game, self._game_state_message(game, move_result))
+
+    @staticmethod
+    def _game_state_message(game: Game, move_result: dict | None = None) -> dict:
+        """Build the game_state WebSocket message, with the last move if given."""
         message = {
             "type": "game_state",
             "game": game.to_dict(),
@@ -602,22 +667,53 @@ class ChessServer:
                 message["gameOver"] = True
                 message["result"] = move_result.get("result")
 
-        await self._broadcast(game, message)
+        return message
+
+    def _queue(self, game: Game, message: dict):
+        """
+        Queue a message for a game's players.
+
+        Messages queued before the event loop next runs are sent together
+        as a single {"type": "batch", "events": [...]} frame.
+        """
+        pending = self._pending.get(game.id)
+        if pending is None:
+            self._pending[game.id] = [message]
+            task = asyncio.create_task(self._flush(game))
+            self._flush_tasks.add(task)
+            task.add_done_callback(self._flush_tasks.discard)
+        else:
+            pending.append(message)
 
-    async def _broadcast(self, game: Game, message: dict):
-        """Send message to all players in a game."""
-        for player in [game.white, game.black]:
-            if player.type == PlayerType.HUMAN and player.id:
-                ws = self.connections.get(player.id)
-                if ws and not ws.closed:
-                    await self._send(ws, message)
+    async def _flush(self, game: Game):
+        """Send a game's queued messages."""
+        events = self._pending.pop(game.id, None)
+        if not events:
+            return
+        if len(events) == 1:
+            await self._broadcast(game, events[0])
+        else:
+            await self._broadcast(game, {"type": "batch", "events": events})
 
-    async def _send(self, ws: web.WebSocketResponse, message: dict):
-        """Send a JSON message to a WebSocket."""
+    async def _broadcast(self, game: Game, message: dict | bytes):
+        """Send message (or already-encoded JSON bytes) to all players in a game."""
+        # Sockets leave game.targets as soon as their connection ends
+        targets = game.targets
+        if not targets:
+            return
+
+        # Encode once and write to every recipient concurrently
+        data = message if isinstance(message, bytes) else orjson.dumps(message)
+        await asyncio.gather(*(self._send(ws, data) for ws in targets))
+
+    async def _send(self, ws: web.WebSocketResponse, message: dict | bytes):
+        """Send a JSON message (or already-encoded JSON bytes) to a WebSocket."""
+        data = message if isinstance(message, bytes) else orjson.dumps(message)
         try:
-            await ws.send_json(message)
+            # Always a text frame: the UI JSON.parses event.data
+            await ws.send_frame(data, WSMsgType.TEXT)
         except Exception as e:
-            logger.error(f"Failed to send message: {e}")
+            logger.error("Failed to send message: %s", e)
 
 
 async def run_server(host: str = "localhost", port: int = 8765):
@@ -635,9 +731,17 @@ async def run_server(host: str = "localhost", port: int = 8765):
         await server.stop()
 
 
+def serve(host: str = "localhost", port: int = 8765):
+    """Run the chess server to completion, on uvloop when it is available."""
+    if uvloop is not None:
+        uvloop.run(run_server(host, port))
+    else:
+        asyncio.run(run_server(host, port))
+
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
-    asyncio.run(run_server())
+    serve()
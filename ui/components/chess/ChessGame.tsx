@@ -37,6 +37,7 @@ interface WebSocketMessage {
   sender?: string;
   senderName?: string;
   error?: string;
+  events?: WebSocketMessage[];
 }
 
 export function ChessGame() {
@@ -89,7 +90,12 @@ export function ChessGame() {
 
     socket.onmessage = (event) => {
       const data: WebSocketMessage = JSON.parse(event.data);
-      handleMessage(data);
+      // The server coalesces messages sent together into one batch frame
+      if (data.type === "batch") {
+        data.events?.forEach(handleMessage);
+      } else {
+        handleMessage(data);
+      }
     };
 
     wsRef.current = socket;
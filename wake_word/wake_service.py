@@ -3,11 +3,11 @@
 This script runs continuously in the background, listening for the wake word.
 """
 
-import atexit
 import logging
 import os
 import signal
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -38,6 +38,17 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+def _sleep_unless(stop_requested: threading.Event, seconds: float) -> None:
+    """Sleep in short slices so a shutdown signal ends the wait promptly."""
+    # Event.wait is not interruptible by Ctrl+C on Windows, time.sleep is
+    deadline = time.monotonic() + seconds
+    while not stop_requested.is_set():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(0.25, remaining))
+
+
 def main():
     """Main service entry point."""
     logger = setup_logging()
@@ -62,37 +73,38 @@ def main():
 
     detector = None
     retry_count = 0
+    stop_requested = threading.Event()
 
     def cleanup_handler(signum=None, frame=None):
         """Handle shutdown signals gracefully."""
         logger.info("Shutdown signal received. Cleaning up...")
+        # Let the detector loop finish its current frame and clean up itself
+        # rather than exiting from inside it
+        stop_requested.set()
         if detector:
-            detector.stop()
-        logger.info("Wake word service stopped cleanly")
-        sys.exit(0)
+            detector.is_running = False
 
     signal.signal(signal.SIGINT, cleanup_handler)
     signal.signal(signal.SIGTERM, cleanup_handler)
-    atexit.register(lambda: cleanup_handler() if detector else None)
 
-    while retry_count < max_retries:
+    while retry_count < max_retries and not stop_requested.is_set():
         try:
             logger.info(f"Initializing wake word detector (sensitivity: {sensitivity})")
             detector = WakeWordDetector(
                 access_key=access_key,
                 sensitivity=sensitivity,
+                stop_event=stop_requested,
             )
 
             logger.info("Wake word detector initialized successfully")
             logger.info("🎤 Listening for 'Hey ANA'...")
             logger.info("Press Ctrl+C to stop")
 
+            # A signal may have arrived while the detector was being built
+            if stop_requested.is_set():
+                break
             detector.start()
 
-        except KeyboardInterrupt:
-            logger.info("Service stopped by user")
-            break
-
         except Exception as e:
             retry_count += 1
             logger.error(f"Error in wake word detector: {e}", exc_info=True)
@@ -102,7 +114,7 @@ def main():
                 logger.info(
                     f"Retrying in {wait_time} seconds... (Attempt {retry_count}/{max_retries})"
                 )
-                time.sleep(wait_time)
+                _sleep_unless(stop_requested, wait_time)
             else:
                 logger.error("Max retries reached. Service stopping.")
                 break